@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory model of the DigComp question bank
+Repeated strings are interned, options are stored as tuples with the correct
+answer index hoisted out, and comments are kept compressed until accessed
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+import zlib
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Number of comments compressed together; reading one comment inflates its block
+COMMENT_BLOCK_SIZE = 32
+
+
+class _CommentStore:
+    """
+    Comments of one bank, kept as zlib-compressed blocks
+    Holds no reference to the questions, so banks are freed without the cyclic GC
+    """
+
+    __slots__ = ("_starts", "_ends", "_blocks", "_cached_block")
+
+    def __init__(self, comments: List[Optional[str]]):
+        # Byte range of each comment inside its decompressed block, -1 if absent
+        self._starts = array("l")
+        self._ends = array("l")
+        self._blocks: List[bytes] = []
+
+        for block_start in range(0, len(comments), COMMENT_BLOCK_SIZE):
+            block = bytearray()
+            for commentaire in comments[block_start:block_start + COMMENT_BLOCK_SIZE]:
+                if commentaire is None:
+                    self._starts.append(-1)
+                    self._ends.append(-1)
+                    continue
+                self._starts.append(len(block))
+                block += commentaire.encode("utf-8")
+                self._ends.append(len(block))
+            self._blocks.append(zlib.compress(bytes(block), 9))
+
+        # Most recently inflated (block index, block), swapped as a single tuple
+        self._cached_block: Tuple[int, bytes] = (-1, b"")
+
+    def get(self, index: int) -> Optional[str]:
+        """Return the comment at a non-negative index, or None if absent"""
+        start = self._starts[index]
+        if start < 0:
+            return None
+
+        block_index = index // COMMENT_BLOCK_SIZE
+        cached_index, block = self._cached_block
+        if cached_index != block_index:
+            block = zlib.decompress(self._blocks[block_index])
+            self._cached_block = (block_index, block)
+
+        return block[start:self._ends[index]].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+class Question:
+    """
+    A single quiz question stored in a fixed-size record
+    The comment is resolved through the bank's comment store so it can stay compressed
+    """
+
+    __slots__ = ("_comments", "_index", "domaine", "competence", "niveau",
+                 "points", "question", "options", "correct_index")
+
+    def __init__(
+        self,
+        comments: _CommentStore,
+        index: int,
+        domaine: str,
+        competence: str,
+        niveau: str,
+        points: int,
+        question: str,
+        options: Tuple[str, ...],
+        correct_index: int
+    ):
+        self._comments = comments
+        self._index = index
+        self.domaine = domaine
+        self.competence = competence
+        self.niveau = niveau
+        self.points = points
+        self.question = question
+        self.options = options
+        self.correct_index = correct_index
+
+    @property
+    def commentaire(self) -> Optional[str]:
+        """Comment shown after answering, decompressed on demand (None if absent)"""
+        return self._comments.get(self._index)
+
+    def is_correct(self, option_index: int) -> bool:
+        """
+        Check whether the given option is the correct answer
+
+        Args:
+            option_index: Index of the selected option
+
+        Returns:
+            True if the option is the correct one, False otherwise
+        """
+        return option_index == self.correct_index
+
+    def to_dict(self) -> Dict:
+        """
+        Rebuild the original JSON structure for this question
+
+        Returns:
+            Dictionary in the questions_digcomp_final.json format
+        """
+        result = {
+            "domaine": self.domaine,
+            "competence": self.competence,
+            "niveau": self.niveau,
+            "points": self.points,
+            "question": self.question,
+            "options": [
+                {"text": text, "isCorrect": i == self.correct_index}
+                for i, text in enumerate(self.options)
+            ]
+        }
+        commentaire = self.commentaire
+        if commentaire is not None:
+            result["commentaire"] = commentaire
+        return result
+
+
+class QuestionBank:
+    """
+    Compact, read-only collection of questions
+
+    Domain names, competences, levels and option texts are interned with
+    sys.intern, so they are stored once per process even when several bank
+    versions are loaded side by side. Comments are owned by the bank as
+    zlib-compressed blocks, independent of the file they were loaded from.
+    Questions reference the comment store rather than the bank, so a bank
+    is freed by reference counting as soon as it is dropped.
+    """
+
+    def __init__(self, questions: List[Dict]):
+        """
+        Build a bank from the raw question dictionaries
+
+        Args:
+            questions: Questions in the questions_digcomp_final.json format
+
+        Raises:
+            ValueError: If a question does not have exactly one correct option
+        """
+        self._comments = _CommentStore([raw.get("commentaire") for raw in questions])
+        self._questions: List[Question] = [
+            self._build_question(index, raw) for index, raw in enumerate(questions)
+        ]
+
+    def _build_question(self, index: int, raw: Dict) -> Question:
+        options = raw.get("options", [])
+        correct = [i for i, option in enumerate(options) if option.get("isCorrect", False)]
+        if len(correct) != 1:
+            raise ValueError(
+                f"Question {index} must have exactly one correct option, found {len(correct)}"
+            )
+
+        return Question(
+            self._comments,
+            index,
+            sys.intern(raw.get("domaine", "")),
+            sys.intern(raw.get("competence", "")),
+            sys.intern(raw.get("niveau", "")),
+            raw.get("points", 1),
+            raw.get("question", ""),
+            tuple(sys.intern(option.get("text", "")) for option in options),
+            correct[0]
+        )
+
+    @classmethod
+    def load(cls, questions_file: str = "questions_digcomp_final.json") -> "QuestionBank":
+        """
+        Load a bank from a JSON file
+
+        The file is only read during this call; replacing it afterwards does
+        not affect the loaded bank.
+
+        Args:
+            questions_file: Path to questions JSON file
+
+        Returns:
+            QuestionBank instance
+        """
+        with open(questions_file, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def get_commentaire(self, index: int) -> Optional[str]:
+        """
+        Return the comment of a question, decompressing its block if needed
+
+        Args:
+            index: Question index
+
+        Returns:
+            Comment text, or None if the question has no comment
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if not -len(self._questions) <= index < len(self._questions):
+            raise IndexError(f"Question index {index} out of range")
+        return self._comments.get(index % len(self._questions))
+
+    def to_list(self) -> List[Dict]:
+        """
+        Rebuild the original JSON structure for the whole bank
+
+        Returns:
+            List of question dictionaries, usable with calculate_domain_results()
+        """
+        return [question.to_dict() for question in self._questions]
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def __getitem__(self, index: int) -> Question:
+        return self._questions[index]
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self._questions)
+
+
+def measure_memory(loader, *args) -> Tuple[object, int, Optional[int]]:
+    """
+    Measure the memory used while building an object and retained afterwards
+
+    Tracing already started by the caller is left running with its peak
+    untouched; in that case the peak of the call cannot be isolated and
+    None is returned for it.
+
+    Args:
+        loader: Callable building the object to measure
+        *args: Arguments passed to the loader
+
+    Returns:
+        Tuple of (loaded object, retained bytes, peak bytes during the call or None)
+    """
+    if tracemalloc.is_tracing():
+        before = tracemalloc.get_traced_memory()[0]
+        result = loader(*args)
+        after = tracemalloc.get_traced_memory()[0]
+        return result, after - before, None
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = loader(*args)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, after - before, peak - before
+
+
+def _load_json(questions_file: str) -> List[Dict]:
+    with open(questions_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_versions(loader, questions_file: str, count: int) -> List[object]:
+    return [loader(questions_file) for _ in range(count)]
+
+
+def _make_large_bank(questions: List[Dict], scale: int) -> List[Dict]:
+    """
+    Build a larger bank with distinct question texts, correct answers and comments
+
+    Domains, competences, levels and distractors are reused, as they would
+    be in a real bank.
+    """
+    large = []
+    for n in range(scale):
+        for question in questions:
+            copy = json.loads(json.dumps(question))
+            copy["question"] = f"{copy['question']} (variante {n})"
+            if copy.get("commentaire") is not None:
+                copy["commentaire"] = f"{copy['commentaire']} (variante {n})"
+            for option in copy["options"]:
+                if option["isCorrect"]:
+                    option["text"] = f"{option['text']} (variante {n})"
+            large.append(copy)
+    return large
+
+
+def _run_scenario(kind: str, questions_file: str, count: int) -> Tuple[int, int]:
+    """Measure one scenario in a fresh interpreter, so nothing is already interned"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--scenario", kind, questions_file, str(count)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    retained, peak = json.loads(output)
+    return retained, peak
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    if len(sys.argv) == 5 and sys.argv[1] == "--scenario":
+        loaders = {"json": _load_json, "bank": QuestionBank.load}
+        _, retained, peak = measure_memory(
+            _load_versions, loaders[sys.argv[2]], sys.argv[3], int(sys.argv[4])
+        )
+        print(json.dumps([retained, peak]))
+        sys.exit(0)
+
+    print("DigComp Question Bank Memory Benchmark")
+    print("=" * 50)
+
+    questions_file = sys.argv[1] if len(sys.argv) > 1 else "questions_digcomp_final.json"
+    versions = 20
+    scale = 50
+
+    def report(label: str, questions_path: str, count: int):
+        raw_retained, raw_peak = _run_scenario("json", questions_path, count)
+        bank_retained, bank_peak = _run_scenario("bank", questions_path, count)
+        ratio = raw_retained / bank_retained if bank_retained else 0.0
+        print(f"\n📊 {label}")
+        print(f"   json.load     : {raw_retained / 1024:10.1f} KiB retained, "
+              f"{raw_peak / 1024:10.1f} KiB peak")
+        print(f"   QuestionBank  : {bank_retained / 1024:10.1f} KiB retained, "
+              f"{bank_peak / 1024:10.1f} KiB peak")
+        print(f"   Ratio         : {ratio:10.2f}x retained")
+
+    raw = _load_json(questions_file)
+    if QuestionBank(raw).to_list() != raw:
+        raise RuntimeError("QuestionBank does not round-trip the original data")
+
+    report(f"1 bank ({len(raw)} questions)", questions_file, 1)
+    report(f"{versions} bank versions", questions_file, versions)
+
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.json', delete=False) as tmp:
+        json.dump(_make_large_bank(raw, scale), tmp, ensure_ascii=False, indent=2)
+    try:
+        report(f"Large bank ({len(raw) * scale} distinct questions)", tmp.name, 1)
+    finally:
+        os.remove(tmp.name)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact question bank model
+Run with: python -m unittest test_question_bank
+"""
+
+import gc
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+import weakref
+
+from question_bank import COMMENT_BLOCK_SIZE, QuestionBank, measure_memory
+
+QUESTIONS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "questions_digcomp_final.json"
+)
+
+
+def make_question(index: int, correct: int = 1, commentaire: str = "Commentaire") -> dict:
+    question = {
+        "domaine": "DOMAINE 1 : INFORMATIONS ET DONNÉES",
+        "competence": "Rechercher l'information en ligne (Initial)",
+        "niveau": "Initial",
+        "points": 1,
+        "question": f"Q{index}. Question numéro {index} ?",
+        "options": [
+            {"text": f"Option {i}", "isCorrect": i == correct}
+            for i in range(4)
+        ]
+    }
+    if commentaire is not None:
+        question["commentaire"] = f"{commentaire} {index} – « accents »"
+    return question
+
+
+class QuestionBankTest(unittest.TestCase):
+
+    def test_round_trip_questions_file(self):
+        with open(QUESTIONS_FILE, 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+
+        bank = QuestionBank.load(QUESTIONS_FILE)
+
+        self.assertEqual(len(bank), len(questions))
+        self.assertEqual(bank.to_list(), questions)
+
+    def test_round_trip_across_comment_blocks(self):
+        questions = [make_question(i, correct=i % 4) for i in range(COMMENT_BLOCK_SIZE * 2 + 3)]
+        bank = QuestionBank(questions)
+
+        # Read out of order so blocks are inflated repeatedly
+        for index in reversed(range(len(questions))):
+            self.assertEqual(bank[index].commentaire, questions[index]["commentaire"])
+        self.assertEqual(bank.to_list(), questions)
+
+    def test_missing_commentaire_is_preserved(self):
+        questions = [make_question(0), make_question(1, commentaire=None), make_question(2)]
+        bank = QuestionBank(questions)
+
+        self.assertIsNone(bank[1].commentaire)
+        self.assertNotIn("commentaire", bank[1].to_dict())
+        self.assertEqual(bank.to_list(), questions)
+
+    def test_get_commentaire_negative_index(self):
+        questions = [make_question(i) for i in range(COMMENT_BLOCK_SIZE + 5)]
+        bank = QuestionBank(questions)
+
+        self.assertEqual(bank.get_commentaire(-1), questions[-1]["commentaire"])
+        self.assertEqual(bank.get_commentaire(-len(questions)), questions[0]["commentaire"])
+        with self.assertRaises(IndexError):
+            bank.get_commentaire(len(questions))
+        with self.assertRaises(IndexError):
+            bank.get_commentaire(-len(questions) - 1)
+
+    def test_bank_freed_without_cyclic_gc(self):
+        bank = QuestionBank([make_question(i) for i in range(3)])
+        bank[0].commentaire
+        ref = weakref.ref(bank)
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            del bank
+            self.assertIsNone(ref())
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def test_question_outlives_bank(self):
+        question = QuestionBank([make_question(0)])[0]
+
+        self.assertEqual(question.commentaire, make_question(0)["commentaire"])
+
+    def test_correct_index(self):
+        bank = QuestionBank([make_question(0, correct=2)])
+
+        self.assertEqual(bank[0].correct_index, 2)
+        self.assertTrue(bank[0].is_correct(2))
+        self.assertFalse(bank[0].is_correct(0))
+
+    def test_no_correct_option_raises(self):
+        question = make_question(0)
+        for option in question["options"]:
+            option["isCorrect"] = False
+
+        with self.assertRaises(ValueError):
+            QuestionBank([question])
+
+    def test_several_correct_options_raises(self):
+        question = make_question(0)
+        question["options"][0]["isCorrect"] = True
+
+        with self.assertRaises(ValueError):
+            QuestionBank([question])
+
+    def test_bank_survives_file_replacement(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "questions.json")
+            old_questions = [make_question(0, commentaire="Ancien")]
+            new_questions = [make_question(0, commentaire="Nouveau")]
+
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(old_questions, f, ensure_ascii=False)
+            bank = QuestionBank.load(path)
+
+            replacement = os.path.join(tmp_dir, "questions.new.json")
+            with open(replacement, 'w', encoding='utf-8') as f:
+                json.dump(new_questions, f, ensure_ascii=False)
+            os.replace(replacement, path)
+
+            self.assertEqual(bank.to_list(), old_questions)
+            self.assertEqual(QuestionBank.load(path).to_list(), new_questions)
+
+
+class MeasureMemoryTest(unittest.TestCase):
+
+    def test_reports_peak_when_not_tracing(self):
+        def build_and_drop():
+            buffer = bytes(100_000)
+            del buffer
+
+        _, retained, peak = measure_memory(build_and_drop)
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreaterEqual(peak, 100_000)
+        self.assertLess(retained, 100_000)
+
+    def test_keeps_caller_tracing_and_peak(self):
+        tracemalloc.start()
+        try:
+            data = bytes(1_000_000)
+            del data
+            caller_peak = tracemalloc.get_traced_memory()[1]
+
+            _, _, peak = measure_memory(list)
+
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertIsNone(peak)
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], caller_peak)
+        finally:
+            tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()